@@ -10,7 +10,11 @@ from utils.utils import (
     optimise_posters,
     clean_unused_posters,
     copy_static_files,
-    load_library_mapping
+    load_library_mapping,
+    load_previous_catalog,
+    find_duplicate_keys,
+    build_catalog_delta,
+    update_delta_history
 )
 
 CONFIG_DIR = "/config" if os.path.exists("/config/libraries.json") else os.path.dirname(os.path.abspath(__file__))
@@ -94,8 +98,27 @@ def main():
 
     render_site(all_items, config)
 
-    with open(os.path.join(OUTPUT_DIR, "media.json"), "w", encoding="utf-8") as f:
-        json.dump({"all": all_items}, f, indent=2)
+    media_path = os.path.join(OUTPUT_DIR, "media.json")
+    previous = load_previous_catalog(media_path)
+
+    log("Building catalog delta...")
+    delta = build_catalog_delta(previous.get("all", []) if previous else [], all_items)
+    log(f"Delta: {len(delta['added'])} added, {len(delta['changed'])} changed, {len(delta['removed'])} removed")
+
+    with open(media_path, "w", encoding="utf-8") as f:
+        json.dump({"version": delta["to"], "all": all_items}, f, indent=2)
+
+    duplicate_keys = find_duplicate_keys(all_items)
+    if duplicate_keys:
+        log(f"❌ Duplicate item keys, clients will download the full catalog: {', '.join(duplicate_keys)}")
+
+    update_delta_history(
+        os.path.join(OUTPUT_DIR, "deltas.json"),
+        delta if previous and not duplicate_keys else None,
+        delta["to"],
+        [str(i["key"]) for i in all_items],
+        os.path.getsize(media_path)
+    )
 
 if __name__ == "__main__":
     main()
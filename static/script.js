@@ -1,5 +1,6 @@
 document.addEventListener("DOMContentLoaded", async () => {
     let activeTab = "Movies";
+    const CATALOG_CACHE_KEY = `libraryviewer-catalog:${location.pathname}`;
     // ─────────────────────────────
     // 🔧 DOM Elements
     // ─────────────────────────────
@@ -22,9 +23,7 @@ document.addEventListener("DOMContentLoaded", async () => {
     // ─────────────────────────────
     // 🔁 Load Data First
     // ─────────────────────────────
-    const res = await fetch("media.json");
-    const raw = await res.json();
-    const all = raw.all || [];
+    const all = await loadCatalog();
     const data = all.map(item => ({
         ...item,
         type: item.type?.toLowerCase(),
@@ -55,6 +54,73 @@ document.addEventListener("DOMContentLoaded", async () => {
     let activeType = "Movie";
     let activeCollectionFilter = null;
 
+    // ─────────────────────────────
+    // 🗂️ Catalog Cache & Deltas
+    // ─────────────────────────────
+    async function loadCatalog() {
+        const cached = readCachedCatalog();
+        if (cached) {
+            try {
+                const res = await fetch("deltas.json", { cache: "no-cache" });
+                const feed = await res.json();
+                const patched = applyDeltas(cached, feed);
+                if (patched) {
+                    if (patched.version !== cached.version) writeCachedCatalog(patched);
+                    return patched.all;
+                }
+            } catch (e) {
+                console.warn("Delta feed unavailable, downloading full catalog", e);
+            }
+        }
+
+        const res = await fetch("media.json", { cache: "no-cache" });
+        const raw = await res.json();
+        const catalog = { version: raw.version, all: raw.all || [] };
+        writeCachedCatalog(catalog);
+        return catalog.all;
+    }
+
+    function applyDeltas(catalog, feed) {
+        if (catalog.version === feed.version) return catalog;
+
+        const history = feed.history || [];
+        const start = history.findIndex(delta => delta.from === catalog.version);
+        if (start === -1) return null;
+
+        const items = new Map(catalog.all.map(item => [String(item.key), item]));
+        let version = catalog.version;
+        for (const delta of history.slice(start)) {
+            if (delta.from !== version) return null;
+            delta.removed.forEach(key => items.delete(String(key)));
+            [...delta.added, ...delta.changed].forEach(item => items.set(String(item.key), item));
+            version = delta.to;
+        }
+        if (version !== feed.version) return null;
+
+        // Rebuild in the build's order so the first library matches index.html
+        const order = feed.order || [];
+        if (order.length !== items.size || !order.every(key => items.has(key))) return null;
+        return { version, all: order.map(key => items.get(key)) };
+    }
+
+    function readCachedCatalog() {
+        try {
+            const cached = JSON.parse(localStorage.getItem(CATALOG_CACHE_KEY));
+            return cached && cached.version && Array.isArray(cached.all) ? cached : null;
+        } catch {
+            return null;
+        }
+    }
+
+    function writeCachedCatalog(catalog) {
+        try {
+            localStorage.setItem(CATALOG_CACHE_KEY, JSON.stringify(catalog));
+        } catch (e) {
+            console.warn("Catalog too large to cache, it will be downloaded in full on each visit", e);
+            localStorage.removeItem(CATALOG_CACHE_KEY);
+        }
+    }
+
     // ─────────────────────────────
     // 🎨 Utility Functions
     // ─────────────────────────────
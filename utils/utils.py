@@ -3,6 +3,7 @@ import re
 import time
 import json
 import shutil
+import hashlib
 from PIL import Image
 
 CONFIG_DIR = "/config" if os.path.exists("/config/.env") else "."
@@ -41,7 +42,7 @@ def merge_items(jellyfin_items, plex_items):
                 if all(isinstance(i, dict) for i in value):
                     merged[key] = list({json.dumps(i, sort_keys=True): i for i in existing + value}.values())
                 else:
-                    merged[key] = list(set(existing + value))
+                    merged[key] = sorted(set(existing + value), key=str)
             elif isinstance(value, dict):
                 merged[key] = merge_dict(merged.get(key, {}), value)
         return merged
@@ -99,4 +100,79 @@ def clean_unused_posters(all_items):
                 try:
                     os.remove(os.path.join(POSTER_DIR, fname))
                 except Exception:
-                    continue
\ No newline at end of file
+                    continue
+
+DELTA_HISTORY = 24
+DELTA_MAX_FRACTION = 0.5
+
+def hash_item(item):
+    payload = json.dumps(item, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+def catalog_version(hashes):
+    payload = "\n".join(f"{key}:{hashes[key]}" for key in sorted(hashes))
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+def load_previous_catalog(media_path):
+    if not os.path.isfile(media_path):
+        return None
+    try:
+        with open(media_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception as e:
+        log(f"❌ Failed to read previous catalog: {e}")
+        return None
+
+def find_duplicate_keys(items):
+    seen = set()
+    duplicates = set()
+    for item in items:
+        key = str(item["key"])
+        if key in seen:
+            duplicates.add(key)
+        seen.add(key)
+    return sorted(duplicates)
+
+def build_catalog_delta(previous_items, all_items):
+    old = {str(i["key"]): i for i in previous_items}
+    new = {str(i["key"]): i for i in all_items}
+    old_hashes = {k: hash_item(v) for k, v in old.items()}
+    new_hashes = {k: hash_item(v) for k, v in new.items()}
+
+    added = [new[k] for k in new if k not in old]
+    changed = [new[k] for k in new if k in old and new_hashes[k] != old_hashes[k]]
+    removed = [k for k in old if k not in new]
+
+    return {
+        "from": catalog_version(old_hashes),
+        "to": catalog_version(new_hashes),
+        "added": added,
+        "changed": changed,
+        "removed": removed,
+    }
+
+def update_delta_history(deltas_path, delta, version, order, catalog_size):
+    history = []
+    if os.path.isfile(deltas_path):
+        try:
+            with open(deltas_path, "r", encoding="utf-8") as f:
+                history = json.load(f).get("history", [])
+        except Exception as e:
+            log(f"❌ Failed to read delta history: {e}")
+
+    # Clients can only patch across an unbroken chain of deltas
+    if delta is None or (history and history[-1]["to"] != delta["from"]):
+        history = []
+    if delta and delta["from"] != delta["to"]:
+        history.append(delta)
+    history = history[-DELTA_HISTORY:]
+
+    # Keep the feed well below a full download; past that, clients should fetch media.json
+    budget = catalog_size * DELTA_MAX_FRACTION
+    sizes = [len(json.dumps(d)) for d in history]
+    while history and sum(sizes) > budget:
+        history.pop(0)
+        sizes.pop(0)
+
+    with open(deltas_path, "w", encoding="utf-8") as f:
+        json.dump({"version": version, "order": order, "history": history}, f)